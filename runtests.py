@@ -3,6 +3,9 @@
 # python setup.py test
 #   or
 # runtests.py [tests.test_x tests.test_y.SomeTestCase ...]
+#
+# Set ANYMAIL_TEST_PARALLEL=auto (or a number of processes)
+# to run test cases in parallel.
 
 from __future__ import print_function
 import sys
@@ -21,6 +24,7 @@ def setup_and_run_tests(test_labels=None):
 
     tags = envlist('ANYMAIL_ONLY_TEST')
     exclude_tags = envlist('ANYMAIL_SKIP_TESTS')
+    parallel = os.getenv('ANYMAIL_TEST_PARALLEL', '1')
 
     # In automated testing, don't run live tests unless specifically requested
     if envbool('CONTINUOUS_INTEGRATION') and not envbool('RUN_LIVE_TESTS'):
@@ -38,8 +42,20 @@ def setup_and_run_tests(test_labels=None):
         'tests.test_settings.settings_%d_%d' % django.VERSION[:2]
     django.setup()
 
+    if parallel == 'auto':
+        from django.test.runner import default_test_processes
+        parallel = default_test_processes()
+    else:
+        parallel = int(parallel)
+    if parallel > 1:
+        try:
+            import tblib  # NOQA: F401
+        except ImportError:
+            # Django's parallel runner needs tblib to report failures from worker processes
+            sys.exit("ANYMAIL_TEST_PARALLEL requires the tblib package (`pip install tblib`)")
+
     TestRunner = get_runner(settings)
-    test_runner = TestRunner(verbosity=1, tags=tags, exclude_tags=exclude_tags)
+    test_runner = TestRunner(verbosity=1, tags=tags, exclude_tags=exclude_tags, parallel=parallel)
     return test_runner.run_tests(test_labels)
 
 
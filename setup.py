@@ -58,7 +58,7 @@ setup(
     },
     include_package_data=True,
     test_suite="runtests.runtests",
-    tests_require=["mock", "boto3", "sparkpost"],
+    tests_require=["mock", "tblib", "boto3", "sparkpost"],
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Programming Language :: Python",
@@ -1,5 +1,14 @@
 # -*- coding: utf-8 -*-
-
+#
+# Each test case has its own mocks and message, and the only shared module state
+# is the settings override, which setUpModule and tearDownModule enable and disable
+# in matching pairs around each run of this module's tests. So these tests are
+# safe to run with ANYMAIL_TEST_PARALLEL.
+
+import copy
+import json
+import re
+import unittest
 from base64 import b64encode, b64decode
 from calendar import timegm
 from datetime import date, datetime
@@ -13,6 +22,12 @@ from django.test import SimpleTestCase, override_settings, tag
 from django.utils.timezone import get_fixed_timezone, override as override_current_timezone
 from mock import patch
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+import anymail.backends.base
 from anymail.exceptions import (AnymailAPIError, AnymailConfigurationError, AnymailSerializationError,
                                 AnymailUnsupportedFeature, AnymailWarning)
 from anymail.message import attach_inline_image_file
@@ -23,14 +38,53 @@ from .utils import sample_image_content, sample_image_path, SAMPLE_IMAGE_FILENAM
 # noinspection PyUnresolvedReferences
 longtype = int if six.PY3 else long  # NOQA: F821
 
+_json = orjson or json  # faster json parsing for API payload assertions, if available
+
+# Expected UTC timestamps for test_send_at
+_SEND_AT_20160304_130607_UTC = timegm((2016, 3, 4, 13, 6, 7))
+_SEND_AT_20221011_061314_UTC = timegm((2022, 10, 11, 6, 13, 14))
+_SEND_AT_20221021_180000_UTC = timegm((2022, 10, 21, 18, 0, 0))
+
+# Warning issued for legacy templates with merge fields lacking delimiters
+_NO_MERGE_FIELD_DELIMITERS_WARNING = re.compile(r'SENDGRID_MERGE_FIELD_FORMAT')
+
+# Original json.dumps error message, included in AnymailSerializationError
+_NOT_JSON_SERIALIZABLE_DECIMAL = re.compile(r"Decimal.*is not JSON serializable")
+
+# Settings shared by all tests in this module (enabled whenever this module's tests run)
+_settings_override = override_settings(EMAIL_BACKEND='anymail.backends.sendgrid.EmailBackend',
+                                       ANYMAIL={'SENDGRID_API_KEY': 'test_api_key'})
+
+
+def setUpModule():
+    _settings_override.enable()
+
+
+def tearDownModule():
+    _settings_override.disable()
+
+
+# Fixed recipient lists shared by many tests. (Django's EmailMessage copies
+# constructor args to lists, but use list(...) when assigning to a message attr.)
+_TO = ('to@example.com',)
+_MERGE_TO = ('alice@example.com', 'Bob <bob@example.com>')
+_MERGE_TO_WITH_CELIA = _MERGE_TO + ('celia@example.com',)
+
 
 @tag('sendgrid')
-@override_settings(EMAIL_BACKEND='anymail.backends.sendgrid.EmailBackend',
-                   ANYMAIL={'SENDGRID_API_KEY': 'test_api_key'})
 class SendGridBackendMockAPITestCase(RequestsBackendMockAPITestCase):
-    DEFAULT_RAW_RESPONSE = b""  # SendGrid v3 success responses are empty
+    # SendGrid v3 success responses are empty. (The backend doesn't try to parse
+    # them, so there's no json to deserialize for the default mock response.)
+    DEFAULT_RAW_RESPONSE = b""
     DEFAULT_STATUS_CODE = 202  # SendGrid v3 uses '202 Accepted' for success (in most cases)
 
+    @classmethod
+    def setUpClass(cls):
+        super(SendGridBackendMockAPITestCase, cls).setUpClass()
+        # Simple message useful for many tests (copied for each test in setUp)
+        cls.message_template = mail.EmailMultiAlternatives(
+            'Subject', 'Text Body', 'from@example.com', _TO)
+
     def setUp(self):
         super(SendGridBackendMockAPITestCase, self).setUp()
 
@@ -40,18 +94,47 @@ class SendGridBackendMockAPITestCase(RequestsBackendMockAPITestCase):
         patch_uuid4.start()
         self.addCleanup(patch_uuid4.stop)
 
-        # Simple message useful for many tests
-        self.message = mail.EmailMultiAlternatives('Subject', 'Text Body', 'from@example.com', ['to@example.com'])
+        # Shallow copy of the template, with its own copies of all mutable fields
+        # (so one test's changes can't leak into the template or other tests)
+        self.message = copy.copy(self.message_template)
+        for attr in ('to', 'cc', 'bcc', 'reply_to', 'attachments', 'alternatives'):
+            setattr(self.message, attr, list(getattr(self.message_template, attr)))
+        self.message.extra_headers = dict(self.message_template.extra_headers)
+
+    def get_api_call_json(self, required=True):
+        """Returns the data sent to the mock ESP API, json-parsed (with orjson, if installed)"""
+        # SendGridBackend serializes its own payload, so it's always in the data param
+        value = self.get_api_call_arg('data', required=False)
+        if value is not None:
+            return _json.loads(value)
+        return super(SendGridBackendMockAPITestCase, self).get_api_call_json(required)
+
+    def get_headers(self, data=None):
+        """Returns the (json-parsed) custom email headers sent to the mock ESP API
+
+        Pass data if the test already has the result of get_api_call_json.
+        """
+        if data is None:
+            data = self.get_api_call_json()
+        return data['headers']
 
 
 @tag('sendgrid')
 class SendGridBackendStandardEmailTests(SendGridBackendMockAPITestCase):
     """Test backend support for Django standard email features"""
 
+    @classmethod
+    def setUpClass(cls):
+        super(SendGridBackendStandardEmailTests, cls).setUpClass()
+        # Read the sample image once for all the image tests
+        cls.image_filename = SAMPLE_IMAGE_FILENAME
+        cls.image_path = sample_image_path(cls.image_filename)
+        cls.image_data = sample_image_content(cls.image_filename)
+
     def test_send_mail(self):
         """Test basic API for simple send"""
         mail.send_mail('Subject here', 'Here is the message.',
-                       'from@sender.example.com', ['to@example.com'], fail_silently=False)
+                       'from@sender.example.com', _TO, fail_silently=False)
         self.assert_esp_called('https://api.sendgrid.com/v3/mail/send')
         http_headers = self.get_api_call_headers()
         self.assertEqual(http_headers["Authorization"], "Bearer test_api_key")
@@ -84,18 +167,15 @@ class SendGridBackendStandardEmailTests(SendGridBackendMockAPITestCase):
         # single message (single "personalization") sent to all those recipients
         # (note workaround for SendGrid v3 API bug quoting display-name in personalizations)
         self.assertEqual(len(data['personalizations']), 1)
-        self.assertEqual(data['personalizations'][0]['to'], [
-            {'name': '"Recipient #1"', 'email': 'to1@example.com'},
-            {'email': 'to2@example.com'}
-        ])
-        self.assertEqual(data['personalizations'][0]['cc'], [
-            {'name': '"Carbon Copy"', 'email': 'cc1@example.com'},
-            {'email': 'cc2@example.com'}
-        ])
-        self.assertEqual(data['personalizations'][0]['bcc'], [
-            {'name': '"Blind Copy"', 'email': 'bcc1@example.com'},
-            {'email': 'bcc2@example.com'}
-        ])
+        personalization = data['personalizations'][0]
+        self.assertEqual({k: personalization.get(k) for k in ('to', 'cc', 'bcc')}, {
+            'to': [{'name': '"Recipient #1"', 'email': 'to1@example.com'},
+                   {'email': 'to2@example.com'}],
+            'cc': [{'name': '"Carbon Copy"', 'email': 'cc1@example.com'},
+                   {'email': 'cc2@example.com'}],
+            'bcc': [{'name': '"Blind Copy"', 'email': 'bcc1@example.com'},
+                    {'email': 'bcc2@example.com'}],
+        })
 
     def test_email_message(self):
         email = mail.EmailMessage(
@@ -119,11 +199,13 @@ class SendGridBackendStandardEmailTests(SendGridBackendMockAPITestCase):
                 'custom_args': {'anymail_id': 'mocked-uuid-1'},
             }])
 
-        self.assertEqual(data['from'], {'email': "from@example.com"})
-        self.assertEqual(data['subject'], "Subject")
-        self.assertEqual(data['content'], [{'type': "text/plain", 'value': "Body goes here"}])
-        self.assertEqual(data['reply_to'], {'email': "another@example.com"})
-        self.assertEqual(data['headers'], {
+        self.assertEqual({k: data.get(k) for k in ('from', 'subject', 'content', 'reply_to')}, {
+            'from': {'email': "from@example.com"},
+            'subject': "Subject",
+            'content': [{'type': "text/plain", 'value': "Body goes here"}],
+            'reply_to': {'email': "another@example.com"},
+        })
+        self.assertEqual(self.get_headers(data), {
             'X-MyHeader': "my value",
             'Message-ID': "<mycustommsgid@sales.example.com>",
         })
@@ -132,7 +214,7 @@ class SendGridBackendStandardEmailTests(SendGridBackendMockAPITestCase):
         text_content = 'This is an important message.'
         html_content = '<p>This is an <strong>important</strong> message.</p>'
         email = mail.EmailMultiAlternatives('Subject', text_content,
-                                            'from@example.com', ['to@example.com'])
+                                            'from@example.com', _TO)
         email.attach_alternative(html_content, "text/html")
         email.send()
         data = self.get_api_call_json()
@@ -145,7 +227,7 @@ class SendGridBackendStandardEmailTests(SendGridBackendMockAPITestCase):
 
     def test_html_only_message(self):
         html_content = '<p>This is an <strong>important</strong> message.</p>'
-        email = mail.EmailMessage('Subject', html_content, 'from@example.com', ['to@example.com'])
+        email = mail.EmailMessage('Subject', html_content, 'from@example.com', _TO)
         email.content_subtype = "html"  # Main content is now text/html
         email.send()
         data = self.get_api_call_json()
@@ -157,11 +239,12 @@ class SendGridBackendStandardEmailTests(SendGridBackendMockAPITestCase):
                                       'Reply-To': '"Do Not Reply" <noreply@example.com>'}
         self.message.send()
         data = self.get_api_call_json()
-        self.assertEqual(data['headers']['X-Custom'], 'string')
-        self.assertEqual(data['headers']['X-Num'], '123')  # converted to string (undoc'd SendGrid requirement)
-        self.assertEqual(data['headers']['X-Long'], '123')  # converted to string (undoc'd SendGrid requirement)
+        headers = self.get_headers(data)
+        self.assertEqual(headers['X-Custom'], 'string')
+        self.assertEqual(headers['X-Num'], '123')  # converted to string (undoc'd SendGrid requirement)
+        self.assertEqual(headers['X-Long'], '123')  # converted to string (undoc'd SendGrid requirement)
         # Reply-To must be moved to separate param
-        self.assertNotIn('Reply-To', data['headers'])
+        self.assertNotIn('Reply-To', headers)
         self.assertEqual(data['reply_to'], {'name': "Do Not Reply", 'email': "noreply@example.com"})
 
     def test_extra_headers_serialization_error(self):
@@ -174,6 +257,7 @@ class SendGridBackendStandardEmailTests(SendGridBackendMockAPITestCase):
         self.message.send()
         data = self.get_api_call_json()
         self.assertEqual(data['reply_to'], {'name': "Reply recipient", 'email': "reply@example.com"})
+        self.assertNotIn('headers', data)  # not sent as a custom header, and no other headers to send
 
     def test_multiple_reply_to(self):
         # SendGrid v3 prohibits Reply-To in custom headers, and only allows a single reply address
@@ -229,11 +313,7 @@ class SendGridBackendStandardEmailTests(SendGridBackendMockAPITestCase):
         self.assertEqual(b64decode(attachment['content']).decode('utf-8'), u'<p>\u2019</p>')
 
     def test_embedded_images(self):
-        image_filename = SAMPLE_IMAGE_FILENAME
-        image_path = sample_image_path(image_filename)
-        image_data = sample_image_content(image_filename)
-
-        cid = attach_inline_image_file(self.message, image_path)  # Read from a png file
+        cid = attach_inline_image_file(self.message, self.image_path)  # Read from a png file
         html_content = '<p>This has an <img src="cid:%s" alt="inline" /> image.</p>' % cid
         self.message.attach_alternative(html_content, "text/html")
 
@@ -241,29 +321,25 @@ class SendGridBackendStandardEmailTests(SendGridBackendMockAPITestCase):
         data = self.get_api_call_json()
 
         self.assertEqual(data['attachments'][0], {
-            'filename': image_filename,
-            'content': b64encode(image_data).decode('ascii'),
+            'filename': self.image_filename,
+            'content': b64encode(self.image_data).decode('ascii'),
             'type': "image/png",  # type inferred from filename
             'disposition': "inline",
             'content_id': cid,
         })
 
     def test_attached_images(self):
-        image_filename = SAMPLE_IMAGE_FILENAME
-        image_path = sample_image_path(image_filename)
-        image_data = sample_image_content(image_filename)
-
-        self.message.attach_file(image_path)  # option 1: attach as a file
+        self.message.attach_file(self.image_path)  # option 1: attach as a file
 
-        image = MIMEImage(image_data)  # option 2: construct the MIMEImage and attach it directly
+        image = MIMEImage(self.image_data)  # option 2: construct the MIMEImage and attach it directly
         self.message.attach(image)
 
         self.message.send()
 
-        image_data_b64 = b64encode(image_data).decode('ascii')
+        image_data_b64 = b64encode(self.image_data).decode('ascii')
         data = self.get_api_call_json()
         self.assertEqual(data['attachments'][0], {
-            'filename': image_filename,  # the named one
+            'filename': self.image_filename,  # the named one
             'content': image_data_b64,
             'type': "image/png",
         })
@@ -305,36 +381,32 @@ class SendGridBackendStandardEmailTests(SendGridBackendMockAPITestCase):
     def test_api_failure(self):
         self.set_mock_response(status_code=400)
         with self.assertRaisesMessage(AnymailAPIError, "SendGrid API response 400"):
-            mail.send_mail('Subject', 'Body', 'from@example.com', ['to@example.com'])
+            mail.send_mail('Subject', 'Body', 'from@example.com', _TO)
 
         # Make sure fail_silently is respected
         self.set_mock_response(status_code=400)
-        sent = mail.send_mail('Subject', 'Body', 'from@example.com', ['to@example.com'], fail_silently=True)
+        sent = mail.send_mail('Subject', 'Body', 'from@example.com', _TO, fail_silently=True)
         self.assertEqual(sent, 0)
 
     def test_api_error_includes_details(self):
         """AnymailAPIError should include ESP's error message"""
-        # JSON error response:
-        error_response = b"""{"errors":[
+        json_error_response = b"""{"errors":[
             {"message":"Helpful explanation from SendGrid","field":"subject","help":null},
             {"message":"Another error","field":null,"help":null}
         ]}"""
-        self.set_mock_response(status_code=400, raw=error_response)
-        with self.assertRaises(AnymailAPIError) as cm:
-            self.message.send()
-        err = cm.exception
-        self.assertIn("Helpful explanation from SendGrid", str(err))
-        self.assertIn("Another error", str(err))
-
-        # Non-JSON error response:
-        self.set_mock_response(status_code=500, raw=b"Ack! Bad proxy!")
-        with self.assertRaisesMessage(AnymailAPIError, "Ack! Bad proxy!"):
-            self.message.send()
-
-        # No content in the error response:
-        self.set_mock_response(status_code=502, raw=None)
-        with self.assertRaises(AnymailAPIError):
-            self.message.send()
+        cases = (
+            # (status_code, raw response, expected substrings in error)
+            (400, json_error_response, ("Helpful explanation from SendGrid", "Another error")),  # JSON error
+            (500, b"Ack! Bad proxy!", ("Ack! Bad proxy!",)),  # non-JSON error
+            (502, None, ()),  # no content in the error response
+        )
+        for status_code, raw, expected_messages in cases:
+            with self.subTest(status_code=status_code):
+                self.set_mock_response(status_code=status_code, raw=raw)
+                with self.assertRaises(AnymailAPIError) as cm:
+                    self.message.send()
+                for expected_message in expected_messages:
+                    self.assertIn(expected_message, str(cm.exception))
 
 
 @tag('sendgrid')
@@ -366,19 +438,19 @@ class SendGridBackendAnymailFeatureTests(SendGridBackendMockAPITestCase):
             self.message.send_at = datetime(2016, 3, 4, 5, 6, 7, tzinfo=utc_minus_8)
             self.message.send()
             data = self.get_api_call_json()
-            self.assertEqual(data['send_at'], timegm((2016, 3, 4, 13, 6, 7)))  # 05:06 UTC-8 == 13:06 UTC
+            self.assertEqual(data['send_at'], _SEND_AT_20160304_130607_UTC)  # 05:06 UTC-8 == 13:06 UTC
 
             # Timezone-naive datetime assumed to be Django current_timezone
             self.message.send_at = datetime(2022, 10, 11, 12, 13, 14, 567)  # microseconds should get stripped
             self.message.send()
             data = self.get_api_call_json()
-            self.assertEqual(data['send_at'], timegm((2022, 10, 11, 6, 13, 14)))  # 12:13 UTC+6 == 06:13 UTC
+            self.assertEqual(data['send_at'], _SEND_AT_20221011_061314_UTC)  # 12:13 UTC+6 == 06:13 UTC
 
             # Date-only treated as midnight in current timezone
             self.message.send_at = date(2022, 10, 22)
             self.message.send()
             data = self.get_api_call_json()
-            self.assertEqual(data['send_at'], timegm((2022, 10, 21, 18, 0, 0)))  # 00:00 UTC+6 == 18:00-1d UTC
+            self.assertEqual(data['send_at'], _SEND_AT_20221021_180000_UTC)  # 00:00 UTC+6 == 18:00-1d UTC
 
             # POSIX timestamp
             self.message.send_at = 1651820889  # 2022-05-06 07:08:09 UTC
@@ -390,7 +462,7 @@ class SendGridBackendAnymailFeatureTests(SendGridBackendMockAPITestCase):
         self.message.tags = ["receipt", "repeat-user"]
         self.message.send()
         data = self.get_api_call_json()
-        self.assertCountEqual(data['categories'], ["receipt", "repeat-user"])
+        self.assertEqual(sorted(data['categories']), ["receipt", "repeat-user"])
 
     def test_tracking(self):
         # Test one way...
@@ -423,7 +495,7 @@ class SendGridBackendAnymailFeatureTests(SendGridBackendMockAPITestCase):
         #   you do not need to specify those in the respective personalizations or message
         #   level parameters."
         # So make sure we aren't adding body content where not needed:
-        message = mail.EmailMessage(from_email='from@example.com', to=['to@example.com'])
+        message = mail.EmailMessage(from_email='from@example.com', to=_TO)
         message.template_id = "5997fcf6-2b9f-484d-acd5-7e9a99f0dc1f"
         message.send()
         data = self.get_api_call_json()
@@ -436,7 +508,7 @@ class SendGridBackendAnymailFeatureTests(SendGridBackendMockAPITestCase):
         self.message.template_id = "d-5a963add2ec84305813ff860db277d7a"
 
         self.message.from_email = 'from@example.com'
-        self.message.to = ['alice@example.com', 'Bob <bob@example.com>', 'celia@example.com']
+        self.message.to = list(_MERGE_TO_WITH_CELIA)
         self.message.cc = ['cc@example.com']  # gets applied to *each* recipient in a merge
 
         self.message.merge_data = {
@@ -497,7 +569,7 @@ class SendGridBackendAnymailFeatureTests(SendGridBackendMockAPITestCase):
         # unless a new "dynamic template" is specified, Anymail assumes the legacy
         # "substitutions" format for merge data
         self.message.from_email = 'from@example.com'
-        self.message.to = ['alice@example.com', 'Bob <bob@example.com>', 'celia@example.com']
+        self.message.to = list(_MERGE_TO_WITH_CELIA)
         self.message.cc = ['cc@example.com']  # gets applied to *each* recipient in a merge
         # SendGrid template_id is not required to use merge.
         # You can just supply (legacy) template content as the message (e.g.):
@@ -536,7 +608,7 @@ class SendGridBackendAnymailFeatureTests(SendGridBackendMockAPITestCase):
     @override_settings(ANYMAIL_SENDGRID_MERGE_FIELD_FORMAT=":{}")  # :field as shown in SG examples
     def test_legacy_merge_field_format_setting(self):
         # Provide merge field delimiters in settings.py
-        self.message.to = ['alice@example.com', 'Bob <bob@example.com>']
+        self.message.to = list(_MERGE_TO)
         self.message.merge_data = {
             'alice@example.com': {'name': "Alice", 'group': "Developers"},
             'bob@example.com': {'name': "Bob"},  # and leave group undefined
@@ -556,7 +628,7 @@ class SendGridBackendAnymailFeatureTests(SendGridBackendMockAPITestCase):
 
     def test_legacy_merge_field_format_esp_extra(self):
         # Provide merge field delimiters for an individual message
-        self.message.to = ['alice@example.com', 'Bob <bob@example.com>']
+        self.message.to = list(_MERGE_TO)
         self.message.merge_data = {
             'alice@example.com': {'name': "Alice", 'group': "Developers"},
             'bob@example.com': {'name': "Bob"},  # and leave group undefined
@@ -581,16 +653,16 @@ class SendGridBackendAnymailFeatureTests(SendGridBackendMockAPITestCase):
         self.message.merge_data = {
             'alice@example.com': {'name': "Alice", 'group': "Developers"},
         }
-        with self.assertWarnsRegex(AnymailWarning, r'SENDGRID_MERGE_FIELD_FORMAT'):
+        with self.assertWarnsRegex(AnymailWarning, _NO_MERGE_FIELD_DELIMITERS_WARNING):
             self.message.send()
 
     def test_legacy_warn_if_no_global_merge_field_delimiters(self):
         self.message.merge_global_data = {'site': "ExampleCo"}
-        with self.assertWarnsRegex(AnymailWarning, r'SENDGRID_MERGE_FIELD_FORMAT'):
+        with self.assertWarnsRegex(AnymailWarning, _NO_MERGE_FIELD_DELIMITERS_WARNING):
             self.message.send()
 
     def test_merge_metadata(self):
-        self.message.to = ['alice@example.com', 'Bob <bob@example.com>']
+        self.message.to = list(_MERGE_TO)
         self.message.merge_metadata = {
             'alice@example.com': {'order_id': 123},
             'bob@example.com': {'order_id': 678, 'tier': 'premium'},
@@ -610,7 +682,7 @@ class SendGridBackendAnymailFeatureTests(SendGridBackendMockAPITestCase):
         # with message level custom_args, overriding any conflicting keys."
         # So there's no need to merge global metadata with per-recipient merge_metadata
         # (like we have to for template merge_global_data and merge_data).
-        self.message.to = ['alice@example.com', 'Bob <bob@example.com>']
+        self.message.to = list(_MERGE_TO)
         self.message.metadata = {'tier': 'basic', 'batch': 'ax24'}
         self.message.merge_metadata = {
             'alice@example.com': {'order_id': 123},
@@ -628,7 +700,7 @@ class SendGridBackendAnymailFeatureTests(SendGridBackendMockAPITestCase):
 
     def test_merge_metadata_with_merge_data(self):
         # (using dynamic templates)
-        self.message.to = ['alice@example.com', 'Bob <bob@example.com>', 'celia@example.com']
+        self.message.to = list(_MERGE_TO_WITH_CELIA)
         self.message.cc = ['cc@example.com']  # gets applied to *each* recipient in a merge
         self.message.template_id = "d-5a963add2ec84305813ff860db277d7a"
         self.message.merge_data = {
@@ -666,7 +738,7 @@ class SendGridBackendAnymailFeatureTests(SendGridBackendMockAPITestCase):
         ])
 
     def test_merge_metadata_with_legacy_template(self):
-        self.message.to = ['alice@example.com', 'Bob <bob@example.com>', 'celia@example.com']
+        self.message.to = list(_MERGE_TO_WITH_CELIA)
         self.message.cc = ['cc@example.com']  # gets applied to *each* recipient in a merge
         self.message.template_id = "5a963add2ec84305813ff860db277d7a"
         self.message.esp_extra = {'merge_field_format': ':{}'}
@@ -841,7 +913,7 @@ class SendGridBackendAnymailFeatureTests(SendGridBackendMockAPITestCase):
         err = cm.exception
         self.assertIsInstance(err, TypeError)  # compatibility with json.dumps
         self.assertIn("Don't know how to send this data to SendGrid", str(err))  # our added context
-        self.assertRegex(str(err), r"Decimal.*is not JSON serializable")  # original message
+        self.assertRegex(str(err), _NOT_JSON_SERIALIZABLE_DECIMAL)  # original message
 
     @override_settings(ANYMAIL_SENDGRID_WORKAROUND_NAME_QUOTE_BUG=False)
     def test_undocumented_workaround_name_quote_bug_setting(self):
@@ -854,6 +926,33 @@ class SendGridBackendAnymailFeatureTests(SendGridBackendMockAPITestCase):
                          {"email": "from@example.com", "name": "Sender, Inc."})
 
 
+@tag('sendgrid')
+@unittest.skipUnless(orjson is not None, "orjson not installed")
+class SendGridBackendOrjsonTests(SendGridBackendMockAPITestCase):
+    """Representative backend tests, with the payload serialized by orjson rather than json"""
+
+    class OrjsonModule(object):
+        """Stand-in for the json module in anymail.backends.base, serializing with orjson"""
+        @staticmethod
+        def dumps(obj, default=None):
+            # (only supports the json.dumps options BasePayload.serialize_json uses)
+            return orjson.dumps(obj, default=default).decode('utf-8')
+
+    def setUp(self):
+        super(SendGridBackendOrjsonTests, self).setUp()
+        # Patch only the backend's json module reference, not the stdlib json module
+        patch_json = patch.object(anymail.backends.base, 'json', self.OrjsonModule)
+        patch_json.start()
+        self.addCleanup(patch_json.stop)
+
+    test_email_message = six.get_unbound_function(SendGridBackendStandardEmailTests.test_email_message)
+    test_extra_headers = six.get_unbound_function(SendGridBackendStandardEmailTests.test_extra_headers)
+    test_metadata = six.get_unbound_function(SendGridBackendAnymailFeatureTests.test_metadata)
+    test_send_at = six.get_unbound_function(SendGridBackendAnymailFeatureTests.test_send_at)
+    test_extra_headers_serialization_error = six.get_unbound_function(
+        SendGridBackendStandardEmailTests.test_extra_headers_serialization_error)
+
+
 @tag('sendgrid')
 class SendGridBackendRecipientsRefusedTests(SendGridBackendMockAPITestCase):
     """Should raise AnymailRecipientsRefused when *all* recipients are rejected or invalid"""
@@ -871,17 +970,16 @@ class SendGridBackendSessionSharingTestCase(SessionSharingTestCasesMixin, SendGr
 
 
 @tag('sendgrid')
-@override_settings(EMAIL_BACKEND="anymail.backends.sendgrid.EmailBackend")
+@override_settings(ANYMAIL={})  # remove the module's SENDGRID_API_KEY setting
 class SendGridBackendImproperlyConfiguredTests(SimpleTestCase, AnymailTestMixin):
     """Test ESP backend without required settings in place"""
 
     def test_missing_auth(self):
         with self.assertRaisesRegex(AnymailConfigurationError, r'\bSENDGRID_API_KEY\b'):
-            mail.send_mail('Subject', 'Message', 'from@example.com', ['to@example.com'])
+            mail.send_mail('Subject', 'Message', 'from@example.com', _TO)
 
 
 @tag('sendgrid')
-@override_settings(EMAIL_BACKEND="anymail.backends.sendgrid.EmailBackend")
 class SendGridBackendDisallowsV2Tests(SimpleTestCase, AnymailTestMixin):
     """Using v2-API-only features should cause errors with v3 backend"""
 
@@ -892,12 +990,11 @@ class SendGridBackendDisallowsV2Tests(SimpleTestCase, AnymailTestMixin):
             AnymailConfigurationError,
             "SendGrid v3 API doesn't support username/password auth; Please change to API key."
         ):
-            mail.send_mail('Subject', 'Message', 'from@example.com', ['to@example.com'])
+            mail.send_mail('Subject', 'Message', 'from@example.com', _TO)
 
-    @override_settings(ANYMAIL={'SENDGRID_API_KEY': 'test_api_key'})
     def test_esp_extra_smtpapi(self):
         """x-smtpapi in the esp_extra indicates a desire to use the v2 api"""
-        message = mail.EmailMessage('Subject', 'Body', 'from@example.com', ['to@example.com'])
+        message = mail.EmailMessage('Subject', 'Body', 'from@example.com', _TO)
         message.esp_extra = {'x-smtpapi': {'asm_group_id': 1}}
         with self.assertRaisesMessage(
             AnymailConfigurationError,
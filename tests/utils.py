@@ -115,6 +115,12 @@ class AnymailTestMixin:
         finally:
             warnings.resetwarnings()
 
+    def subTest(self, *args, **params):
+        try:
+            return super(AnymailTestMixin, self).subTest(*args, **params)
+        except (AttributeError, TypeError):
+            return _null_context()  # Python 2: no subtests, just run the block
+
     def assertCountEqual(self, *args, **kwargs):
         try:
             return super(AnymailTestMixin, self).assertCountEqual(*args, **kwargs)
@@ -190,6 +196,11 @@ class AnymailTestMixin:
             sys.stdout = old_stdout
 
 
+@contextmanager
+def _null_context():
+    yield
+
+
 # Backported from Python 3.4
 class _AssertLogsContext(object):
     """A context manager used to implement TestCase.assertLogs()."""